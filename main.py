@@ -1,39 +1,127 @@
 """WeDraftSync command line entry point."""
 from __future__ import annotations
 
-from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Sequence, TextIO
+import argparse
+import json
 import logging
+import os
+import queue
+import sys
+import threading
+import time
 
-try:  # pragma: no cover - optional dependency handling
-    import yaml  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - executed only when PyYAML is missing
-    yaml = None  # type: ignore[assignment]
-
-from utils.reader import load_articles_from_folder
+from utils.reader import iter_articles_from_folder
 from utils.uploader import upload_draft
 from utils.wx_token import get_access_token
 
 LOG_FILE_NAME = "upload_log.txt"
+CONFIG_CACHE_FILE_NAME = ".config.cache.json"
+LOG_FLUSH_EVERY = 50
+LOG_BUFFER_SIZE = 64 * 1024
+DEFAULT_UPLOAD_WORKERS = 8
+
+_TRUE_LITERALS = frozenset({"true", "1", "yes", "y", "on"})
+_FALSE_LITERALS = frozenset({"false", "0", "no", "n", "off"})
+
+
+def _import_yaml() -> tuple[Any, Any] | None:
+    """Import PyYAML on demand and pick its fastest safe loader.
+
+    PyYAML is only needed when the JSON config cache misses. The libyaml-backed
+    ``CSafeLoader`` is much faster but is only available when PyYAML was built
+    against libyaml (e.g. ``apt install libyaml-dev`` before
+    ``pip install PyYAML``); otherwise the pure-Python loader is used.
+    """
+    try:  # pragma: no cover - optional dependency handling
+        import yaml  # type: ignore
+    except ModuleNotFoundError:  # pragma: no cover - executed only when PyYAML is missing
+        return None
+
+    try:
+        from yaml import CSafeLoader as loader  # type: ignore
+    except ImportError:  # pragma: no cover - depends on the PyYAML build
+        from yaml import SafeLoader as loader  # type: ignore
+
+    return yaml, loader
+
+
+def _config_cache_key(config_path: Path, stat_result: os.stat_result) -> dict[str, Any]:
+    """Return the header identifying a specific version of ``config_path``."""
+    return {
+        "path": str(config_path.resolve()),
+        "mtime_ns": stat_result.st_mtime_ns,
+        "size": stat_result.st_size,
+    }
+
+
+def _read_config_cache(cache_path: Path, cache_key: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the cached configuration when it matches ``cache_key``.
+
+    The cache file stores the key as a JSON header on its first line followed
+    by the parsed configuration, so stale caches are rejected without parsing
+    the body.
+    """
+    try:
+        with cache_path.open("r", encoding="utf-8") as file:
+            if json.loads(file.readline()) != cache_key:
+                return None
+            cached_config = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    return cached_config if isinstance(cached_config, dict) else None
+
+
+def _write_config_cache(cache_path: Path, cache_key: dict[str, Any], config: dict[str, Any]) -> None:
+    """Persist the parsed configuration next to ``config.yaml``."""
+    try:
+        body = json.dumps(config, ensure_ascii=False)
+    except (TypeError, ValueError):
+        logging.debug("Configuration contains values that cannot be cached as JSON.")
+        return
+
+    try:
+        with cache_path.open("w", encoding="utf-8") as file:
+            file.write(json.dumps(cache_key, ensure_ascii=False))
+            file.write("\n")
+            file.write(body)
+    except OSError as exc:
+        logging.debug("Failed to write configuration cache %s: %s", cache_path, exc)
 
 
 def _load_config(config_path: Path) -> dict[str, Any]:
-    """Load configuration from ``config.yaml`` when available."""
-    if not config_path.exists():
+    """Load configuration from ``config.yaml`` when available.
+
+    The parsed mapping is cached as JSON keyed by the file's modification time
+    and size, so unchanged configurations skip YAML parsing entirely.
+    """
+    try:
+        stat_result = config_path.stat()
+    except OSError:
         logging.warning("Configuration file %s not found. Using default values.", config_path)
         return {}
 
-    if yaml is None:
+    cache_path = config_path.with_name(CONFIG_CACHE_FILE_NAME)
+    cache_key = _config_cache_key(config_path, stat_result)
+    cached_config = _read_config_cache(cache_path, cache_key)
+    if cached_config is not None:
+        return cached_config
+
+    yaml_support = _import_yaml()
+    if yaml_support is None:
         logging.warning(
             "PyYAML is not installed. Unable to parse %s; falling back to defaults.",
             config_path,
         )
         return {}
 
+    yaml, loader = yaml_support
     try:
         with config_path.open("r", encoding="utf-8") as file:
-            loaded_config = yaml.safe_load(file)
+            loaded_config = yaml.load(file, Loader=loader)
     except Exception as exc:  # pylint: disable=broad-except
         logging.error("Failed to load configuration file %s: %s", config_path, exc)
         return {}
@@ -42,20 +130,72 @@ def _load_config(config_path: Path) -> dict[str, Any]:
         logging.warning("Configuration file %s did not contain a mapping.", config_path)
         return {}
 
-    return {str(key): value for key, value in loaded_config.items()}
+    if all(isinstance(key, str) for key in loaded_config):
+        config = loaded_config
+    else:
+        config = {str(key): value for key, value in loaded_config.items()}
+    _write_config_cache(cache_path, cache_key, config)
+    return config
 
 
-def _write_log_entry(log_path: Path, status: str, title: str, detail: str) -> None:
-    """Append a formatted entry to the upload log file."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    entry = f"{timestamp} | {status} | 标题：{title} | {detail}\n"
+class LogWriter:
+    """Buffered, thread-safe writer for the upload log file.
 
-    try:
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("a", encoding="utf-8") as log_file:
-            log_file.write(entry)
-    except OSError as exc:
-        logging.error("Failed to write log entry to %s: %s", log_path, exc)
+    The file is opened once per run and flushed every ``flush_every`` entries
+    instead of being reopened for each record.
+    """
+
+    def __init__(self, log_path: Path, flush_every: int = LOG_FLUSH_EVERY) -> None:
+        self._log_path = log_path
+        self._flush_every = flush_every
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._fh: TextIO | None = None
+
+        try:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = log_path.open("a", encoding="utf-8", buffering=LOG_BUFFER_SIZE)
+        except OSError as exc:
+            logging.error("Failed to open log file %s: %s", log_path, exc)
+
+    def write(self, status: str, title: str, detail: str) -> None:
+        """Append a formatted entry to the upload log file."""
+        if self._fh is None:
+            return
+
+        now = time.localtime()
+        timestamp = (
+            f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d} "
+            f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+        )
+        entry = f"{timestamp} | {status} | 标题：{title} | {detail}\n"
+
+        with self._lock:
+            try:
+                self._fh.write(entry)
+                self._pending += 1
+                if self._pending >= self._flush_every:
+                    self._fh.flush()
+                    self._pending = 0
+            except OSError as exc:
+                logging.error("Failed to write log entry to %s: %s", self._log_path, exc)
+
+    def close(self) -> None:
+        """Flush pending entries and close the log file."""
+        with self._lock:
+            if self._fh is None:
+                return
+            try:
+                self._fh.close()
+            except OSError as exc:
+                logging.error("Failed to flush log file %s: %s", self._log_path, exc)
+            self._fh = None
+
+    def __enter__(self) -> "LogWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
 
 def _extract_credentials(config: dict[str, Any]) -> tuple[str, str]:
@@ -67,25 +207,111 @@ def _extract_credentials(config: dict[str, Any]) -> tuple[str, str]:
 
 def _to_bool(value: Any, default: bool) -> bool:
     """Best-effort conversion of configuration values to booleans."""
-    if isinstance(value, bool):
+    if value is True or value is False:
         return value
 
     if value is None:
         return default
 
     if isinstance(value, str):
+        if value in _TRUE_LITERALS:
+            return True
+        if value in _FALSE_LITERALS:
+            return False
+
         normalized = value.strip().lower()
-        if normalized in {"true", "1", "yes", "y", "on"}:
+        if normalized in _TRUE_LITERALS:
             return True
-        if normalized in {"false", "0", "no", "n", "off"}:
+        if normalized in _FALSE_LITERALS:
             return False
 
     return bool(value)
 
 
-def main() -> None:
+def _to_positive_int(value: Any, default: int) -> int:
+    """Best-effort conversion of configuration values to positive integers."""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return default
+
+    return number if number > 0 else default
+
+
+def _produce_articles(
+    articles: Iterable[dict[str, str]],
+    task_queue: queue.Queue[tuple[int, dict[str, str]] | None],
+    worker_count: int,
+) -> None:
+    """Feed articles into ``task_queue`` and signal workers when done."""
+    try:
+        for index, article in enumerate(articles, start=1):
+            task_queue.put((index, article))
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.error("Failed to load articles: %s", exc)
+    finally:
+        for _ in range(worker_count):
+            task_queue.put(None)
+
+
+def _upload_worker(
+    access_token: str,
+    task_queue: queue.Queue[tuple[int, dict[str, str]] | None],
+    result_queue: queue.Queue[tuple[int, str, str, Exception | None] | None],
+) -> None:
+    """Upload queued articles until the ``None`` sentinel is received."""
+    while True:
+        task = task_queue.get()
+        if task is None:
+            result_queue.put(None)
+            return
+
+        index, article = task
+        title = article.get("title", "未命名")
+        content = article.get("content", "")
+
+        try:
+            media_id = upload_draft(access_token, title, content)
+        except Exception as exc:  # pylint: disable=broad-except
+            result_queue.put((index, title, "", exc))
+        else:
+            result_queue.put((index, title, media_id, None))
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Upload local text files as WeChat drafts.")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="preview the articles that would be uploaded without calling the WeChat API",
+    )
+    return parser.parse_args(argv)
+
+
+def _preview_articles(articles: Iterable[dict[str, str]]) -> None:
+    """Log a short preview of each article instead of uploading it."""
+    count = 0
+    try:
+        for count, article in enumerate(articles, start=1):
+            title = article.get("title", "未命名")
+            preview = article.get("content", "")[:50].replace("\n", " ").strip()
+            logging.info("[%s] 《%s》 | %s", count, title, preview)
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.error("Failed to load articles: %s", exc)
+
+    logging.info("预览完成，共 %s 篇文章（未上传）。", count)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
     """Main entry point coordinating WeChat draft uploads."""
-    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    args = _parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s: %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
 
     config_path = Path("config.yaml")
     config = _load_config(config_path)
@@ -93,16 +319,24 @@ def main() -> None:
     text_folder = Path(str(config.get("text_folder", "./articles")))
     use_filename_as_title = _to_bool(config.get("use_filename_as_title", True), True)
 
+    articles = iter_articles_from_folder(str(text_folder), use_filename_as_title)
+
+    # Read the first article before requesting a token so that an empty folder
+    # exits early; the rest are read while uploads are already in flight.
     try:
-        articles = load_articles_from_folder(str(text_folder), use_filename_as_title)
+        first_article = next(articles, None)
     except Exception as exc:  # pylint: disable=broad-except
         logging.error("Failed to load articles from %s: %s", text_folder, exc)
         return
 
-    if not articles:
+    if first_article is None:
         logging.info("No articles were loaded from folder %s.", text_folder)
         return
 
+    if args.dry_run:
+        _preview_articles(chain([first_article], articles))
+        return
+
     appid, appsecret = _extract_credentials(config)
 
     if not appid or not appsecret:
@@ -120,43 +354,66 @@ def main() -> None:
         return
 
     log_path = Path(LOG_FILE_NAME)
-    total_articles = len(articles)
     success_count = 0
     failure_count = 0
 
-    logging.info("开始上传，共 %s 篇文章。", total_articles)
+    upload_workers = _to_positive_int(
+        config.get("upload_workers", DEFAULT_UPLOAD_WORKERS), DEFAULT_UPLOAD_WORKERS
+    )
+    task_queue: queue.Queue[tuple[int, dict[str, str]] | None] = queue.Queue(maxsize=2 * upload_workers)
+    result_queue: queue.Queue[tuple[int, str, str, Exception | None] | None] = queue.Queue()
 
-    for index, article in enumerate(articles, start=1):
-        title = article.get("title", "未命名")
-        content = article.get("content", "")
-        progress_prefix = f"[{index}/{total_articles}]"
+    logging.info("开始上传，并发数 %s。", upload_workers)
 
-        print(f"{progress_prefix} 正在上传：《{title}》")
+    threads = [
+        threading.Thread(
+            target=_produce_articles,
+            args=(chain([first_article], articles), task_queue, upload_workers),
+            name="article-reader",
+            daemon=True,
+        )
+    ]
+    threads.extend(
+        threading.Thread(
+            target=_upload_worker,
+            args=(access_token, task_queue, result_queue),
+            name=f"draft-uploader-{number}",
+            daemon=True,
+        )
+        for number in range(1, upload_workers + 1)
+    )
+    for thread in threads:
+        thread.start()
+
+    with LogWriter(log_path) as log_writer:
+        active_workers = upload_workers
+        while active_workers:
+            result = result_queue.get()
+            if result is None:
+                active_workers -= 1
+                continue
+
+            index, title, media_id, error = result
+            progress_prefix = f"[{index}]"
+
+            if error is not None:
+                failure_count += 1
+                error_message = f"异常: {error}"
+                logging.error("%s 上传失败：《%s》 | %s", progress_prefix, title, error_message)
+                log_writer.write("失败", title, f"原因: {error_message}")
+            elif media_id:
+                success_count += 1
+                logging.info("%s 上传成功：《%s》 | media_id: %s", progress_prefix, title, media_id)
+                log_writer.write("成功", title, f"media_id: {media_id}")
+            else:
+                failure_count += 1
+                error_message = "上传失败，未返回 media_id"
+                logging.error("%s 上传失败：《%s》 | %s", progress_prefix, title, error_message)
+                log_writer.write("失败", title, f"原因: {error_message}")
+
+    for thread in threads:
+        thread.join()
 
-        try:
-            media_id = upload_draft(access_token, title, content)
-        except Exception as exc:  # pylint: disable=broad-except
-            failure_count += 1
-            error_message = f"异常: {exc}"
-            print(f"{progress_prefix} 上传失败：《{title}》 | {error_message}")
-            logging.error("Failed to upload article '%s': %s", title, exc)
-            _write_log_entry(log_path, "失败", title, f"原因: {error_message}")
-            continue
-
-        if media_id:
-            success_count += 1
-            print(f"{progress_prefix} 上传成功：《{title}》 | media_id: {media_id}")
-            logging.info("文章《%s》上传成功，media_id=%s", title, media_id)
-            _write_log_entry(log_path, "成功", title, f"media_id: {media_id}")
-        else:
-            failure_count += 1
-            error_message = "上传失败，未返回 media_id"
-            print(f"{progress_prefix} 上传失败：《{title}》 | {error_message}")
-            logging.error("Article '%s' upload did not return a media_id.", title)
-            _write_log_entry(log_path, "失败", title, f"原因: {error_message}")
-
-    print("上传完成")
-    print(f"成功: {success_count} 篇，失败: {failure_count} 篇")
     logging.info("上传完成，成功 %s 篇，失败 %s 篇。", success_count, failure_count)
 
 
@@ -0,0 +1,118 @@
+"""Shared HTTP session for requests sent to the WeChat API.
+
+The HTTP libraries are imported and the clients created on first use, so
+runs that never reach the network do not pay for importing them.
+"""
+from __future__ import annotations
+
+import functools
+import threading
+from typing import Any
+
+_POOL_SIZE = 16
+_JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+_UNSET: Any = object()
+_INIT_LOCK = threading.Lock()
+_SESSION: Any = _UNSET
+_HTTP2_CLIENT: Any = _UNSET
+
+
+@functools.lru_cache(maxsize=None)
+def _get_requests() -> Any:
+    """Import :mod:`requests` on first use."""
+    import requests
+
+    return requests
+
+
+@functools.lru_cache(maxsize=None)
+def _get_httpx() -> Any | None:
+    """Import :mod:`httpx` on first use, or return ``None`` without HTTP/2 support."""
+    try:  # pragma: no cover - optional dependency branch
+        import h2  # type: ignore  # noqa: F401 - httpx needs h2 for HTTP/2
+        import httpx  # type: ignore
+    except ModuleNotFoundError:  # pragma: no cover - executed only when httpx[http2] is missing
+        return None
+    return httpx
+
+
+def _build_session() -> Any:
+    """Create a keep-alive session with a connection pool sized for uploads.
+
+    Retries only apply to idempotent methods (urllib3's default), so a failed
+    draft ``POST`` is never replayed and cannot create duplicate drafts.
+    """
+    requests = _get_requests()
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_SIZE,
+        pool_maxsize=_POOL_SIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def _build_http2_client() -> Any | None:
+    """Create a shared HTTP/2 client when ``httpx[http2]`` is installed.
+
+    Concurrent uploads are multiplexed as streams over a single TLS
+    connection instead of each holding its own HTTP/1.1 connection.
+    """
+    httpx = _get_httpx()
+    if httpx is None:
+        return None
+
+    return httpx.Client(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=_POOL_SIZE, max_keepalive_connections=_POOL_SIZE),
+    )
+
+
+def get_session() -> Any:
+    """Return the shared :class:`requests.Session`, creating it on first use."""
+    global _SESSION
+    if _SESSION is _UNSET:
+        with _INIT_LOCK:
+            if _SESSION is _UNSET:
+                _SESSION = _build_session()
+    return _SESSION
+
+
+def get_http2_client() -> Any | None:
+    """Return the shared HTTP/2 client, or ``None`` when httpx is unavailable."""
+    global _HTTP2_CLIENT
+    if _HTTP2_CLIENT is _UNSET:
+        with _INIT_LOCK:
+            if _HTTP2_CLIENT is _UNSET:
+                _HTTP2_CLIENT = _build_http2_client()
+    return _HTTP2_CLIENT
+
+
+@functools.lru_cache(maxsize=None)
+def transport_errors() -> tuple[type[Exception], ...]:
+    """Return the exceptions raised by either transport for network failures."""
+    errors: tuple[type[Exception], ...] = (_get_requests().RequestException,)
+    httpx = _get_httpx()
+    if httpx is not None:
+        errors += (httpx.HTTPError,)
+    return errors
+
+
+def post_json(url: str, body: bytes, *, timeout: float = 10.0) -> Any:
+    """POST an already encoded JSON ``body`` using the best available transport.
+
+    The HTTP/2 client is preferred; otherwise the pooled requests session is
+    used. Both returned response objects expose ``status_code`` and ``content``.
+    """
+    http2_client = get_http2_client()
+    if http2_client is not None:
+        return http2_client.post(url, content=body, headers=_JSON_HEADERS, timeout=timeout)
+    return get_session().post(url, data=body, headers=_JSON_HEADERS, timeout=timeout)
@@ -1,21 +1,94 @@
 """Utility helpers for loading text articles from disk."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
+_MAX_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_MAX_CONTENT_CHARS = 20000
+
+
+def _read_one(txt_file: Path) -> str | None:
+    """Return up to the first 20,000 characters of ``txt_file``.
+
+    Only the characters that are kept are read from disk. ``None`` is returned
+    when the file cannot be read or decoded.
+    """
+    try:
+        with txt_file.open("r", encoding="utf-8", errors="strict") as file:
+            return file.read(_MAX_CONTENT_CHARS)
+    except UnicodeDecodeError:
+        logger.warning(
+            "Skipping file '%s' because it could not be decoded with UTF-8.",
+            txt_file,
+        )
+    except OSError as exc:
+        logger.warning("Unable to read file '%s': %s", txt_file, exc)
+    return None
+
+
+def iter_articles_from_folder(folder_path: str, use_filename_as_title: bool = True) -> Iterator[dict[str, str]]:
+    """Yield ``.txt`` articles from ``folder_path`` one at a time.
+
+    Articles are yielded in file name order as soon as each file has been read,
+    so callers can start processing the first article while later files are
+    still being loaded. See :func:`load_articles_from_folder` for details on
+    file selection, truncation and title derivation.
+    """
+    folder = Path(folder_path)
+
+    if not folder.exists() or not folder.is_dir():
+        logger.warning("The folder '%s' does not exist or is not a directory.", folder)
+        return
+
+    # ``DirEntry.is_file`` reuses the file type reported by the directory
+    # listing, avoiding a separate ``stat`` call for every entry.
+    with os.scandir(folder) as iterator:
+        entries = [
+            entry
+            for entry in iterator
+            if os.path.splitext(entry.name)[1].lower() == ".txt" and entry.is_file()
+        ]
+    entries.sort(key=lambda entry: entry.name.lower())
+    txt_files = [Path(entry.path) for entry in entries]
+
+    if not txt_files:
+        logger.info("No .txt files found in folder '%s'.", folder)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(txt_files))) as executor:
+        for txt_file, content in zip(txt_files, executor.map(_read_one, txt_files)):
+            if content is None:
+                continue
+
+            normalized_content = content.strip()
+
+            if use_filename_as_title:
+                title = txt_file.stem
+            else:
+                title_candidate = normalized_content[:100]
+                title = title_candidate if title_candidate else txt_file.stem
+
+            yield {
+                "title": title,
+                "content": content,
+            }
+
 
 def load_articles_from_folder(folder_path: str, use_filename_as_title: bool = True) -> list[dict[str, str]]:
     """Load ``.txt`` articles from ``folder_path`` sorted by file name.
 
     This helper iterates over the immediate children of ``folder_path`` and
     collects every file whose extension is ``.txt`` (case insensitive).
-    Each file is read using UTF-8 encoding and truncated to the first 20,000
-    characters to prevent excessive memory usage. Files that cannot be decoded
-    are skipped with a warning message. The resulting list preserves the file
-    name order, making it suitable for uploading drafts sequentially.
+    Files are read concurrently using UTF-8 encoding and only the first 20,000
+    characters are loaded to prevent excessive memory usage. Files that cannot
+    be decoded are skipped with a warning message. The resulting list preserves
+    the file name order, making it suitable for uploading drafts sequentially.
 
     Args:
         folder_path: Path to the directory containing ``.txt`` files.
@@ -31,51 +104,4 @@ def load_articles_from_folder(folder_path: str, use_filename_as_title: bool = Tr
         the directory is missing, not a directory, or does not contain ``.txt``
         files.
     """
-    folder = Path(folder_path)
-    articles: list[dict[str, str]] = []
-
-    if not folder.exists() or not folder.is_dir():
-        logger.warning("The folder '%s' does not exist or is not a directory.", folder)
-        return articles
-
-    txt_files = sorted(
-        (path for path in folder.iterdir() if path.is_file() and path.suffix.lower() == ".txt"),
-        key=lambda path: path.name.lower(),
-    )
-
-    if not txt_files:
-        logger.info("No .txt files found in folder '%s'.", folder)
-        return articles
-
-    for txt_file in txt_files:
-        try:
-            content = txt_file.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            logger.warning(
-                "Skipping file '%s' because it could not be decoded with UTF-8.",
-                txt_file,
-            )
-            continue
-        except OSError as exc:
-            logger.warning("Unable to read file '%s': %s", txt_file, exc)
-            continue
-
-        if len(content) > 20000:
-            content = content[:20000]
-
-        normalized_content = content.strip()
-
-        if use_filename_as_title:
-            title = txt_file.stem
-        else:
-            title_candidate = normalized_content[:100]
-            title = title_candidate if title_candidate else txt_file.stem
-
-        articles.append(
-            {
-                "title": title,
-                "content": content,
-            }
-        )
-
-    return articles
+    return list(iter_articles_from_folder(folder_path, use_filename_as_title))
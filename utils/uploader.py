@@ -1,14 +1,72 @@
 """Helpers for uploading drafts to the WeChat Official Account platform."""
 from __future__ import annotations
 
+import functools
+import json
 import logging
+import threading
 from typing import Any, Dict
 
-import requests
+try:  # pragma: no cover - optional dependency branch
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - executed only when orjson is missing
+    orjson = None  # type: ignore[assignment]
+
+from .http_session import post_json, transport_errors
 
 logger = logging.getLogger(__name__)
 
 _API_ENDPOINT = "https://api.weixin.qq.com/cgi-bin/draft/add"
+# Article flags for the common call without a digest or any options enabled.
+_DEFAULT_ARTICLE_FLAGS = {"show_cover_pic": 0, "need_open_comment": 0, "only_fans_can_comment": 0}
+_MARKDOWN_LOCAL = threading.local()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_markdown2() -> Any | None:
+    """Import :mod:`markdown2` on first use, or return ``None`` when missing."""
+    try:  # pragma: no cover - optional dependency branch
+        import markdown2  # type: ignore
+    except ModuleNotFoundError:  # pragma: no cover - executed only when markdown2 is missing
+        return None
+    return markdown2
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Encode ``payload`` as compact UTF-8 JSON, using :mod:`orjson` when available.
+
+    Non-ASCII text is kept as UTF-8 instead of ``\\uXXXX`` escapes, which keeps
+    request bodies for Chinese articles considerably smaller.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Decode a JSON response body, using :mod:`orjson` when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _get_markdowner() -> Any:
+    """Return this thread's reusable :class:`markdown2.Markdown` instance.
+
+    ``Markdown`` keeps per-conversion state, so instances are not shared
+    between upload threads.
+    """
+    markdowner = getattr(_MARKDOWN_LOCAL, "markdowner", None)
+    if markdowner is None:
+        markdowner = _get_markdown2().Markdown()
+        _MARKDOWN_LOCAL.markdowner = markdowner
+    return markdowner
+
+
+@functools.lru_cache(maxsize=256)
+def _md_to_html(content: str) -> str:
+    """Convert Markdown ``content`` to HTML, memoizing repeated inputs."""
+    return _get_markdowner().convert(content)
 
 
 def _convert_content(content: str, is_markdown: bool) -> str:
@@ -16,18 +74,15 @@ def _convert_content(content: str, is_markdown: bool) -> str:
     if not is_markdown:
         return content
 
-    try:  # pragma: no cover - optional dependency branch
-        import markdown2  # type: ignore
-    except ModuleNotFoundError:
+    if _get_markdown2() is None:
         message = (
             "markdown2 library is not installed. Uploading original content without "
             "Markdown conversion."
         )
         logger.warning(message)
-        print(message)
         return content
 
-    return markdown2.markdown(content)
+    return _md_to_html(content)
 
 
 def upload_draft(
@@ -72,38 +127,42 @@ def upload_draft(
     if not access_token:
         message = "Access token is required to upload drafts."
         logger.error(message)
-        print(message)
         return ""
 
     if not title or not content:
         message = "Both title and content are required to upload drafts."
         logger.error(message)
-        print(message)
         return ""
 
     html_content = _convert_content(content, is_markdown)
 
     url = f"{_API_ENDPOINT}?access_token={access_token}"
 
-    article_payload: Dict[str, Any] = {
-        "title": title,
-        "content": html_content,
-        "show_cover_pic": int(bool(show_cover_pic)),
-        "need_open_comment": int(bool(need_open_comment)),
-        "only_fans_can_comment": int(bool(only_fans_can_comment)),
-    }
-
-    if digest:
-        article_payload["digest"] = digest
+    if not (digest or show_cover_pic or need_open_comment or only_fans_can_comment):
+        article_payload: Dict[str, Any] = {
+            "title": title,
+            "content": html_content,
+            **_DEFAULT_ARTICLE_FLAGS,
+        }
+    else:
+        article_payload = {
+            "title": title,
+            "content": html_content,
+            "show_cover_pic": int(bool(show_cover_pic)),
+            "need_open_comment": int(bool(need_open_comment)),
+            "only_fans_can_comment": int(bool(only_fans_can_comment)),
+        }
+
+        if digest:
+            article_payload["digest"] = digest
 
     payload = {"articles": [article_payload]}
 
     try:
-        response = requests.post(url, json=payload, timeout=10)
-    except requests.RequestException as exc:
+        response = post_json(url, _dumps(payload), timeout=10)
+    except transport_errors() as exc:
         message = f"Network error while uploading draft: {exc}"
         logger.error(message)
-        print(message)
         return ""
 
     if response.status_code != 200:
@@ -112,15 +171,13 @@ def upload_draft(
             f"{response.status_code} while uploading draft."
         )
         logger.error(message)
-        print(message)
         return ""
 
     try:
-        data = response.json()
+        data = _loads(response.content)
     except ValueError as exc:  # pragma: no cover - defensive
         message = f"Failed to parse JSON response from WeChat API: {exc}"
         logger.error(message)
-        print(message)
         return ""
 
     media_id = data.get("media_id")
@@ -131,5 +188,4 @@ def upload_draft(
     errmsg = data.get("errmsg", "Unknown error")
     message = f"Failed to upload draft. errcode={errcode}, errmsg={errmsg}"
     logger.error(message)
-    print(message)
     return ""
@@ -1,77 +1,102 @@
 """Utilities for retrieving WeChat public account access tokens."""
 from __future__ import annotations
 
-import json
 import logging
+import sqlite3
+import threading
 import time
+from contextlib import closing
 from pathlib import Path
-from typing import Any, Dict
+from typing import Dict, Tuple
 
-import requests
+from .http_session import get_session, transport_errors
 
-_CACHE_FILE = Path(__file__).resolve().parent.parent / ".access_token_cache.json"
+_CACHE_FILE = Path(__file__).resolve().parent.parent / ".access_token_cache.sqlite"
 _CACHE_SAFETY_WINDOW = 60  # seconds
 
+# Process-local copy of valid tokens so repeated lookups skip the cache file.
+_MEM_CACHE: Dict[str, Tuple[str, float]] = {}
+_MEM_LOCK = threading.Lock()
 
-def _load_cache() -> Dict[str, Any]:
-    """Load cached access tokens from disk."""
+
+def _connect_cache() -> sqlite3.Connection:
+    """Open the token cache database, creating the table when needed."""
+    connection = sqlite3.connect(_CACHE_FILE, timeout=5)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS tokens ("
+        "appid TEXT PRIMARY KEY, token TEXT NOT NULL, expires_at REAL NOT NULL)"
+    )
+    return connection
+
+
+def _load_cached_entry(appid: str) -> Tuple[str, float] | None:
+    """Return the ``(token, expires_at)`` row stored for ``appid``."""
     if not _CACHE_FILE.exists():
-        return {}
+        return None
 
     try:
-        with _CACHE_FILE.open("r", encoding="utf-8") as file:
-            data = json.load(file)
-    except (json.JSONDecodeError, OSError) as exc:
+        with closing(_connect_cache()) as connection:
+            row = connection.execute(
+                "SELECT token, expires_at FROM tokens WHERE appid = ?", (appid,)
+            ).fetchone()
+    except sqlite3.Error as exc:
         logging.warning("Failed to read cache file %s: %s", _CACHE_FILE, exc)
-        return {}
+        return None
 
-    if not isinstance(data, dict):
-        logging.warning("Cache file %s did not contain a mapping. Ignoring.", _CACHE_FILE)
-        return {}
+    if row is None:
+        return None
 
-    return data
+    access_token, expires_at = row
+    if not isinstance(access_token, str) or not isinstance(expires_at, (int, float)):
+        return None
+
+    return access_token, float(expires_at)
 
 
-def _save_cache(cache: Dict[str, Any]) -> None:
-    """Persist the access token cache to disk."""
+def _store_cached_entry(appid: str, access_token: str, expires_at: float) -> None:
+    """Insert or replace the cached token row for ``appid``."""
     try:
-        with _CACHE_FILE.open("w", encoding="utf-8") as file:
-            json.dump(cache, file, ensure_ascii=False, indent=2)
-    except OSError as exc:
+        with closing(_connect_cache()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO tokens (appid, token, expires_at) VALUES (?, ?, ?)",
+                (appid, access_token, expires_at),
+            )
+    except sqlite3.Error as exc:
         logging.warning("Failed to write cache file %s: %s", _CACHE_FILE, exc)
 
 
 def _get_cached_token(appid: str) -> str:
-    """Return the cached token for ``appid`` when still valid."""
-    cache = _load_cache()
-    if not cache:
-        return ""
+    """Return the cached token for ``appid`` when still valid.
 
-    entry = cache.get(appid)
-    if not isinstance(entry, dict):
-        return ""
-
-    access_token = entry.get("access_token")
-    expires_at = entry.get("expires_at", 0)
+    The in-memory cache is consulted first; the cache database is only queried
+    on a miss and a valid entry found there is kept in memory for later calls.
+    """
+    with _MEM_LOCK:
+        entry = _MEM_CACHE.get(appid)
+    if entry is not None and time.time() < entry[1]:
+        return entry[0]
 
-    if not isinstance(access_token, str) or not isinstance(expires_at, (int, float)):
+    entry = _load_cached_entry(appid)
+    if entry is None:
         return ""
 
+    access_token, expires_at = entry
     if time.time() >= expires_at:
         return ""
 
+    with _MEM_LOCK:
+        _MEM_CACHE[appid] = (access_token, expires_at)
+
     return access_token
 
 
 def _update_cache(appid: str, access_token: str, expires_in: int) -> None:
-    """Update the cache with the freshly retrieved access token."""
+    """Update the memory and disk caches with the freshly retrieved token."""
     expires_at = time.time() + max(0, expires_in - _CACHE_SAFETY_WINDOW)
-    cache = _load_cache()
-    cache[appid] = {
-        "access_token": access_token,
-        "expires_at": expires_at,
-    }
-    _save_cache(cache)
+    with _MEM_LOCK:
+        _MEM_CACHE[appid] = (access_token, expires_at)
+
+    _store_cached_entry(appid, access_token, expires_at)
 
 
 def get_access_token(appid: str, appsecret: str) -> str:
@@ -105,8 +130,8 @@ def get_access_token(appid: str, appsecret: str) -> str:
     ).format(appid=appid, secret=appsecret)
 
     try:
-        response = requests.get(request_url, timeout=10)
-    except requests.RequestException as exc:
+        response = get_session().get(request_url, timeout=10)
+    except transport_errors() as exc:
         logging.error("Network error while fetching access token: %s", exc)
         return ""
 